@@ -212,7 +212,7 @@ class Accounting(BaseModule, ConsensusModule):
         catalist_validators = self.w3.catalist_validators.get_catalist_validators(blockstamp)
 
         count = len(catalist_validators)
-        total_balance = Gwei(sum(int(validator.balance) for validator in catalist_validators))
+        total_balance = Gwei(sum(validator.balance for validator in catalist_validators))
 
         logger.info({'msg': 'Calculate consensus catalist state.', 'value': (count, total_balance)})
         return count, total_balance
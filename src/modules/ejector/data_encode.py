@@ -27,7 +27,7 @@ def encode_data(validators_to_eject: list[tuple[NodeOperatorGlobalIndex, Catalis
     for (module_id, op_id), validator in validators:
         result += module_id.to_bytes(MODULE_ID_LENGTH)
         result += op_id.to_bytes(NODE_OPERATOR_ID_LENGTH)
-        result += int(validator.index).to_bytes(VALIDATOR_INDEX_LENGTH)
+        result += validator.index.to_bytes(VALIDATOR_INDEX_LENGTH)
 
         pubkey_bytes = hex_str_to_bytes(HexStr(validator.validator.pubkey))
 
@@ -44,7 +44,7 @@ def sort_validators_to_eject(
 ) -> list[tuple[NodeOperatorGlobalIndex, CatalistValidator]]:
     def _nog_validator_key(no_validator: tuple[NodeOperatorGlobalIndex, CatalistValidator]) -> tuple[int, int, int]:
         (module_id, no_id), validator = no_validator
-        return module_id, no_id, int(validator.index)
+        return module_id, no_id, validator.index
 
     validators = sorted(validators_to_eject, key=_nog_validator_key)
 
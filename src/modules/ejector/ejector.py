@@ -1,6 +1,7 @@
 import logging
 from functools import reduce
 
+from more_itertools import ilen
 from web3.types import Wei
 
 from src.constants import (
@@ -212,7 +213,7 @@ class Ejector(BaseModule, ConsensusModule):
         return result
 
     def _get_predicted_withdrawable_balance(self, validator: Validator) -> Wei:
-        return self.w3.to_wei(min(int(validator.balance), MAX_EFFECTIVE_BALANCE), 'gwei')
+        return self.w3.to_wei(min(validator.balance, MAX_EFFECTIVE_BALANCE), 'gwei')
 
     def _get_total_el_balance(self, blockstamp: BlockStamp) -> Wei:
         total_el_balance = Wei(
@@ -284,7 +285,7 @@ class Ejector(BaseModule, ConsensusModule):
         latest_to_exit_validators_count = 0
 
         for validator in self.w3.cc.get_validators(blockstamp):
-            val_exit_epoch = EpochNumber(int(validator.validator.exit_epoch))
+            val_exit_epoch = EpochNumber(validator.validator.exit_epoch)
 
             if val_exit_epoch == FAR_FUTURE_EPOCH:
                 continue
@@ -302,10 +303,12 @@ class Ejector(BaseModule, ConsensusModule):
         """Returns amount of epochs that will take to sweep all validators in chain."""
         validators = self.w3.cc.get_validators(blockstamp)
 
-        total_withdrawable_validators = len(list(filter(lambda validator: (
-            is_partially_withdrawable_validator(validator) or
-            is_fully_withdrawable_validator(validator, blockstamp.ref_epoch)
-        ), validators)))
+        ref_epoch = blockstamp.ref_epoch
+
+        total_withdrawable_validators = ilen(
+            validator for validator in validators
+            if is_partially_withdrawable_validator(validator) or is_fully_withdrawable_validator(validator, ref_epoch)
+        )
 
         chain_config = self.get_chain_config(blockstamp)
         full_sweep_in_epochs = total_withdrawable_validators / MAX_WITHDRAWALS_PER_PAYLOAD / chain_config.slots_per_epoch
@@ -313,10 +316,10 @@ class Ejector(BaseModule, ConsensusModule):
 
     @lru_cache(maxsize=1)
     def _get_churn_limit(self, blockstamp: ReferenceBlockStamp) -> int:
-        total_active_validators = reduce(
-            lambda total, validator: total + int(is_active_validator(validator, blockstamp.ref_epoch)),
-            self.w3.cc.get_validators(blockstamp),
-            0,
+        ref_epoch = blockstamp.ref_epoch
+        total_active_validators = ilen(
+            validator for validator in self.w3.cc.get_validators(blockstamp)
+            if is_active_validator(validator, ref_epoch)
         )
         return max(MIN_PER_EPOCH_CHURN_LIMIT, total_active_validators // CHURN_LIMIT_QUOTIENT)
 
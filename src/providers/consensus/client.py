@@ -9,6 +9,7 @@ from src.providers.consensus.typings import (
     BlockHeaderResponseData,
     BlockRootResponse,
     Validator,
+    ValidatorState,
     BeaconSpecResponse,
     GenesisResponse,
 )
@@ -23,6 +24,26 @@ logger = logging.getLogger(__name__)
 LiteralState = Literal['head', 'genesis', 'finalized', 'justified']
 
 
+def decode_validator(**data) -> Validator:
+    """CL returns the whole registry, so build Validator directly and parse uint strings once"""
+    state = data['validator']
+    return Validator(
+        index=int(data['index']),
+        balance=int(data['balance']),
+        status=data['status'],
+        validator=ValidatorState(
+            pubkey=state['pubkey'],
+            withdrawal_credentials=state['withdrawal_credentials'],
+            effective_balance=int(state['effective_balance']),
+            slashed=state['slashed'],
+            activation_eligibility_epoch=int(state['activation_eligibility_epoch']),
+            activation_epoch=int(state['activation_epoch']),
+            exit_epoch=int(state['exit_epoch']),
+            withdrawable_epoch=int(state['withdrawable_epoch']),
+        ),
+    )
+
+
 class ConsensusClient(HTTPProvider):
     """
     API specifications can be found here
@@ -101,7 +122,7 @@ class ConsensusClient(HTTPProvider):
         """Spec: https://ethereum.github.io/beacon-APIs/#/Beacon/getStateValidators"""
         return self.get_validators_no_cache(blockstamp)
 
-    @list_of_dataclasses(Validator.from_response)
+    @list_of_dataclasses(decode_validator)
     def get_validators_no_cache(self, blockstamp: BlockStamp, pub_keys: Optional[str | tuple] = None) -> list[dict]:
         """Spec: https://ethereum.github.io/beacon-APIs/#/Beacon/getStateValidators"""
         try:
@@ -82,23 +82,23 @@ class ValidatorStatus(Enum):
     WITHDRAWAL_DONE = 'withdrawal_done'
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidatorState(FromResponse):
-    # All uint variables presents in str
+    # CL returns all uint variables in str, they are parsed into int once on decoding in ConsensusClient
     pubkey: str
     withdrawal_credentials: str
-    effective_balance: str
+    effective_balance: int
     slashed: bool
-    activation_eligibility_epoch: str
-    activation_epoch: str
-    exit_epoch: str
-    withdrawable_epoch: str
+    activation_eligibility_epoch: int
+    activation_epoch: int
+    exit_epoch: int
+    withdrawable_epoch: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Validator(Nested, FromResponse):
-    index: str
-    balance: str
+    index: int
+    balance: int
     status: ValidatorStatus
     validator: ValidatorState
 
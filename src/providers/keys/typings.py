@@ -1,6 +1,8 @@
 from dataclasses import dataclass
+from functools import cached_property
 
 from eth_typing import ChecksumAddress, HexStr
+from hexbytes import HexBytes
 
 from src.utils.dataclass import FromResponse
 
@@ -13,6 +15,11 @@ class CatalistKey(FromResponse):
     used: bool
     moduleAddress: ChecksumAddress
 
+    @cached_property
+    def key_bytes(self) -> bytes:
+        """Raw pubkey, to compare with pubkeys from contract events without hex encoding them"""
+        return HexBytes(self.key)
+
 
 @dataclass
 class KeysApiStatus(FromResponse):
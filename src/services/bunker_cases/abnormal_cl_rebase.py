@@ -315,7 +315,7 @@ class AbnormalClRebase:
 
     @staticmethod
     def calculate_validators_balance_sum(validators: Sequence[Validator]) -> Gwei:
-        return Gwei(sum(int(v.balance) for v in validators))
+        return Gwei(sum(v.balance for v in validators))
 
     @staticmethod
     def calculate_normal_cl_rebase(
@@ -100,7 +100,7 @@ class MidtermSlashingPenalty:
         https://github.com/ethereum/consensus-specs/blob/dev/specs/phase0/beacon-chain.md#slash_validator
         """
         def is_have_impact(v: Validator) -> bool:
-            return v.validator.slashed and int(v.validator.withdrawable_epoch) > ref_epoch
+            return v.validator.slashed and v.validator.withdrawable_epoch > ref_epoch
 
         return list(filter(is_have_impact, validators))
 
@@ -119,14 +119,14 @@ class MidtermSlashingPenalty:
         """
         v = validator.validator
 
-        if int(v.withdrawable_epoch) - int(v.exit_epoch) > MIN_VALIDATOR_WITHDRAWABILITY_DELAY:
-            determined_slashed_epoch = EpochNumber(int(v.withdrawable_epoch) - EPOCHS_PER_SLASHINGS_VECTOR)
+        if v.withdrawable_epoch - v.exit_epoch > MIN_VALIDATOR_WITHDRAWABILITY_DELAY:
+            determined_slashed_epoch = EpochNumber(v.withdrawable_epoch - EPOCHS_PER_SLASHINGS_VECTOR)
             return [determined_slashed_epoch]
 
         earliest_possible_slashed_epoch = max(0, ref_epoch - EPOCHS_PER_SLASHINGS_VECTOR)
         # We get here `min` because exit queue can be greater than `EPOCHS_PER_SLASHINGS_VECTOR`
         # So possible slashed epoch can not be greater than `ref_epoch`
-        latest_possible_epoch = min(ref_epoch, int(v.withdrawable_epoch) - EPOCHS_PER_SLASHINGS_VECTOR)
+        latest_possible_epoch = min(ref_epoch, v.withdrawable_epoch - EPOCHS_PER_SLASHINGS_VECTOR)
         return [EpochNumber(epoch) for epoch in range(earliest_possible_slashed_epoch, latest_possible_epoch + 1)]
 
     @staticmethod
@@ -205,7 +205,7 @@ class MidtermSlashingPenalty:
         adjusted_total_slashing_balance = min(
             slashings * PROPORTIONAL_SLASHING_MULTIPLIER_BELLATRIX, total_balance
         )
-        effective_balance = int(validator.validator.effective_balance)
+        effective_balance = validator.validator.effective_balance
         penalty_numerator = effective_balance // EFFECTIVE_BALANCE_INCREMENT * adjusted_total_slashing_balance
         penalty = penalty_numerator // total_balance * EFFECTIVE_BALANCE_INCREMENT
 
@@ -255,4 +255,4 @@ class MidtermSlashingPenalty:
     @staticmethod
     def get_midterm_penalty_epoch(validator: Validator) -> EpochNumber:
         """https://github.com/ethereum/consensus-specs/blob/dev/specs/phase0/beacon-chain.md#slashings"""
-        return EpochNumber(int(validator.validator.withdrawable_epoch) - EPOCHS_PER_SLASHINGS_VECTOR // 2)
+        return EpochNumber(validator.validator.withdrawable_epoch - EPOCHS_PER_SLASHINGS_VECTOR // 2)
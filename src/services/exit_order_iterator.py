@@ -168,13 +168,14 @@ class ExitOrderIterator:
 
     @staticmethod
     def _validator_index(validator: CatalistValidator) -> int:
-        return int(validator.index)
+        return validator.index
 
     @staticmethod
     def operator_index_by_validator(
         staking_module_id: dict[ChecksumAddress, StakingModuleId], validator: CatalistValidator
     ) -> NodeOperatorGlobalIndex:
+        # Called for every validator on each queue sort, values of staking_module_id are already StakingModuleId
         return (
-            StakingModuleId(staking_module_id[validator.catalist_id.moduleAddress]),
+            staking_module_id[validator.catalist_id.moduleAddress],
             NodeOperatorId(validator.catalist_id.operatorIndex),
         )
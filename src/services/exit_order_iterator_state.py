@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Sequence
 
 from more_itertools import ilen
 
@@ -93,12 +94,12 @@ class ExitOrderIteratorStateService(CatalistValidatorStateService):
         catalist_node_operator_stats: dict[NodeOperatorGlobalIndex, NodeOperatorPredictableState]
     ) -> int:
         """Get total predictable validators count for stake weight calculation"""
-        catalist_validators = {
-            v.validator.pubkey: v for v in self.w3.catalist_validators.get_catalist_validators(blockstamp)
+        catalist_validators_pubkeys = {
+            v.validator.pubkey for v in self.w3.catalist_validators.get_catalist_validators(blockstamp)
         }
         not_catalist_predictable_validators_count = ilen(
             v for v in self.w3.cc.get_validators(blockstamp)
-            if v.validator.pubkey not in catalist_validators and not is_on_exit(v)
+            if v.validator.pubkey not in catalist_validators_pubkeys and not is_on_exit(v)
         )
         catalist_predictable_validators_count = sum(
             o.predictable_validators_count for o in catalist_node_operator_stats.values()
@@ -117,43 +118,39 @@ class ExitOrderIteratorStateService(CatalistValidatorStateService):
     @staticmethod
     def count_operator_validators_stats(
         blockstamp: ReferenceBlockStamp,
-        operator_validators: list[CatalistValidator],
+        operator_validators: Sequence[CatalistValidator],
         last_requested_to_exit_index: int,
     ) -> tuple[int, int]:
         """Get operator validators stats for sorting their validators in exit queue"""
 
+        ref_epoch = blockstamp.ref_epoch
         predictable_validators_total_age = 0
         predictable_validators_count = 0
         for validator in operator_validators:
             if ExitOrderIteratorStateService.is_exitable(validator, last_requested_to_exit_index):
-                predictable_validators_total_age += get_validator_age(validator, blockstamp.ref_epoch)
+                predictable_validators_total_age += get_validator_age(validator, ref_epoch)
                 predictable_validators_count += 1
 
         return predictable_validators_total_age, predictable_validators_count
 
     @staticmethod
     def count_operator_delayed_validators(
-        operator_validators: list[CatalistValidator],
+        operator_validators: Sequence[CatalistValidator],
         recently_operator_requested_to_exit_index: set[int],
         last_requested_to_exit_index: int,
     ) -> int:
         """Get delayed validators count for each operator"""
 
-        delayed_validators_count = 0
-
-        for validator in operator_validators:
-            requested_to_exit = int(validator.index) <= last_requested_to_exit_index
-            on_exit = is_on_exit(validator)
-            recently_requested_to_exit = int(validator.index) in recently_operator_requested_to_exit_index
-            if requested_to_exit and not on_exit and not recently_requested_to_exit:
-                delayed_validators_count += 1
-
-        return delayed_validators_count
+        return ilen(
+            validator for validator in operator_validators
+            if ExitOrderIteratorStateService.is_validator_delayed(
+                validator,
+                last_requested_to_exit_index,
+                recently_operator_requested_to_exit_index,
+            )
+        )
 
     @staticmethod
     def is_exitable(validator: CatalistValidator, last_requested_to_exit_index: int) -> bool:
         """Returns True if validator is exitable: not on exit and not requested to exit"""
-        requested_to_exit = int(validator.index) <= last_requested_to_exit_index
-        on_exit = is_on_exit(validator)
-        exitable = not on_exit and not requested_to_exit
-        return exitable
+        return validator.index > last_requested_to_exit_index and not is_on_exit(validator)
@@ -1,9 +1,6 @@
 import logging
-from copy import deepcopy
-from functools import reduce
-from typing import Sequence, Iterable
-
-from eth_typing import HexStr
+from collections import defaultdict
+from typing import Iterable, Sequence
 
 from src.constants import FAR_FUTURE_EPOCH, SHARD_COMMITTEE_PERIOD
 from src.metrics.prometheus.accounting import (
@@ -14,16 +11,17 @@ from src.metrics.prometheus.accounting import (
 from src.modules.accounting.extra_data import ExtraDataService, ExtraData
 from src.modules.accounting.typings import OracleReportLimits
 from src.modules.submodules.typings import ChainConfig
-from src.typings import BlockStamp, ReferenceBlockStamp, EpochNumber
+from src.typings import BlockStamp, ReferenceBlockStamp, EpochNumber, SlotNumber
 from src.utils.abi import named_tuple_to_dataclass
 from src.utils.events import get_events_in_past
-from src.utils.types import bytes_to_hex_str
-from src.utils.validator_state import is_exited_validator, is_validator_eligible_to_exit, is_on_exit
+from src.utils.validator_state import count_exited_validators, is_validator_eligible_to_exit, is_on_exit
 from src.utils.cache import global_lru_cache as lru_cache
 from src.web3py.extensions.catalist_validators import (
     NodeOperatorGlobalIndex,
+    NodeOperatorId,
     CatalistValidator,
     StakingModule,
+    StakingModuleId,
 )
 from src.web3py.typings import Web3
 
@@ -39,6 +37,7 @@ class CatalistValidatorStateService:
 
     @lru_cache(maxsize=1)
     def get_extra_data(self, blockstamp: ReferenceBlockStamp, chain_config: ChainConfig) -> ExtraData:
+        # Steps run sequentially: web3 simple_cache_middleware used in main.py is not thread-safe
         stuck_validators = self.get_catalist_newly_stuck_validators(blockstamp, chain_config)
         logger.info({'msg': 'Calculate stuck validators.', 'value': stuck_validators})
         exited_validators = self.get_catalist_newly_exited_validators(blockstamp)
@@ -58,52 +57,67 @@ class CatalistValidatorStateService:
         catalist_validators_by_no = self.w3.catalist_validators.get_catalist_validators_by_node_operators(blockstamp)
         ejected_index = self.get_operators_with_last_exited_validator_indexes(blockstamp)
         recently_requested_to_exit_pubkeys = self.get_last_requested_to_exit_pubkeys(blockstamp, chain_config)
+        delinquent_timeout_in_slots = self.get_validator_delinquent_timeout_in_slot(blockstamp)
+        node_operators = self.w3.catalist_validators.get_catalist_node_operators(blockstamp)
 
         result = {}
 
-        for global_no_index, validators in catalist_validators_by_no.items():
-            def sum_stuck_validators(total: int, validator: CatalistValidator) -> int:
-                # If validator index is higher than ejected index - we didn't request this validator to exit
-                if int(validator.index) > ejected_index[global_no_index]:
-                    return total
+        for operator in node_operators:
+            global_index = (operator.staking_module.id, operator.id)
 
-                # If validator don't have FAR_FUTURE_EPOCH, then it's already going to exit
-                if int(validator.validator.exit_epoch) != FAR_FUTURE_EPOCH:
-                    return total
+            stuck_validators_count = self.count_operator_stuck_validators(
+                catalist_validators_by_no[global_index],
+                ejected_index[global_index],
+                recently_requested_to_exit_pubkeys,
+                blockstamp.ref_slot,
+                chain_config.slots_per_epoch,
+                delinquent_timeout_in_slots,
+            )
+            ACCOUNTING_STUCK_VALIDATORS.labels(*global_index).set(stuck_validators_count)
 
-                # If validator's pub key in recent events, node operator has still time to eject these validators
-                if validator.catalist_id.key in recently_requested_to_exit_pubkeys:
-                    return total
+            # Find only updated states for Node Operator
+            # If amount of stuck validators weren't changed skip report for operator
+            if stuck_validators_count != operator.stuck_validators_count:
+                result[global_index] = stuck_validators_count
 
-                validator_available_to_exit_epoch = int(validator.validator.activation_epoch) + SHARD_COMMITTEE_PERIOD
-                delinquent_timeout_in_slots = self.get_validator_delinquent_timeout_in_slot(blockstamp)
+        return result
 
-                last_slot_to_exit = validator_available_to_exit_epoch * chain_config.slots_per_epoch + delinquent_timeout_in_slots
+    @staticmethod
+    def count_operator_stuck_validators(
+        operator_validators: Iterable[CatalistValidator],
+        last_requested_to_exit_index: int,
+        recently_requested_to_exit_pubkeys: frozenset[bytes],
+        ref_slot: SlotNumber,
+        slots_per_epoch: int,
+        delinquent_timeout_in_slots: int,
+    ) -> int:
+        """Get count of operator validators that were requested to exit, but didn't exit in time"""
+        stuck_validators_count = 0
 
-                if blockstamp.ref_slot <= last_slot_to_exit:
-                    return total
+        for validator in operator_validators:
+            # If validator index is higher than ejected index - we didn't request this validator to exit
+            if validator.index > last_requested_to_exit_index:
+                continue
 
-                return total + 1
+            # If validator don't have FAR_FUTURE_EPOCH, then it's already going to exit
+            if validator.validator.exit_epoch != FAR_FUTURE_EPOCH:
+                continue
 
-            result[global_no_index] = reduce(
-                sum_stuck_validators,
-                validators,
-                0,
-            )
+            # If validator's pub key in recent events, node operator has still time to eject these validators
+            if validator.catalist_id.key_bytes in recently_requested_to_exit_pubkeys:
+                continue
 
-        # Find only updated states for Node Operator
-        node_operators = self.w3.catalist_validators.get_catalist_node_operators(blockstamp)
+            validator_available_to_exit_epoch = validator.validator.activation_epoch + SHARD_COMMITTEE_PERIOD
+            last_slot_to_exit = validator_available_to_exit_epoch * slots_per_epoch + delinquent_timeout_in_slots
 
-        for operator in node_operators:
-            global_index = (operator.staking_module.id, operator.id)
-            ACCOUNTING_STUCK_VALIDATORS.labels(*global_index).set(result[global_index])
-            # If amount of stuck validators weren't changed skip report for operator
-            if result[global_index] == operator.stuck_validators_count:
-                del result[global_index]
+            if ref_slot <= last_slot_to_exit:
+                continue
 
-        return result
+            stuck_validators_count += 1
 
-    def get_last_requested_to_exit_pubkeys(self, blockstamp: ReferenceBlockStamp, chain_config: ChainConfig) -> set[HexStr]:
+        return stuck_validators_count
+
+    def get_last_requested_to_exit_pubkeys(self, blockstamp: ReferenceBlockStamp, chain_config: ChainConfig) -> frozenset[bytes]:
         exiting_keys_stuck_border_in_slots = self.get_validator_delinquent_timeout_in_slot(blockstamp)
 
         events = get_events_in_past(
@@ -115,7 +129,7 @@ class CatalistValidatorStateService:
 
         logger.info({'msg': f'Fetch exit events. Got {len(events)} events.'})
 
-        return set(bytes_to_hex_str(event['args']['validatorPubkey']) for event in events)
+        return frozenset(event['args']['validatorPubkey'] for event in events)
 
     @lru_cache(maxsize=1)
     def get_validator_delinquent_timeout_in_slot(self, blockstamp: ReferenceBlockStamp) -> int:
@@ -125,14 +139,23 @@ class CatalistValidatorStateService:
 
         return self.w3.to_int(exiting_keys_stuck_border_in_slots_bytes)
 
+    @lru_cache(maxsize=1)
     def get_operators_with_last_exited_validator_indexes(self, blockstamp: BlockStamp) -> dict[NodeOperatorGlobalIndex, int]:
         node_operators = self.w3.catalist_validators.get_catalist_node_operators(blockstamp)
         staking_modules = self.w3.catalist_validators.get_staking_modules(blockstamp)
 
+        node_operators_ids_by_module: defaultdict[StakingModuleId, list[NodeOperatorId]] = defaultdict(list)
+        for operator in node_operators:
+            node_operators_ids_by_module[operator.staking_module.id].append(operator.id)
+
         result = {}
 
         for module in staking_modules:
-            node_operators_ids_in_module = list(map(lambda op: op.id, filter(lambda operator: operator.staking_module.id == module.id, node_operators)))
+            node_operators_ids_in_module = node_operators_ids_by_module[module.id]
+
+            if not node_operators_ids_in_module:
+                # Contract returns empty list for module without operators, so skip the round-trip
+                continue
 
             last_requested_validators = self._get_last_requested_validator_indices(blockstamp, module, node_operators_ids_in_module)
 
@@ -143,7 +166,8 @@ class CatalistValidatorStateService:
 
     @lru_cache(maxsize=1)
     def get_catalist_newly_exited_validators(self, blockstamp: ReferenceBlockStamp) -> dict[NodeOperatorGlobalIndex, int]:
-        catalist_validators = deepcopy(self.get_exited_catalist_validators(blockstamp))
+        # Values are immutable ints, so a shallow copy is enough to keep the cached result untouched
+        catalist_validators = dict(self.get_exited_catalist_validators(blockstamp))
         node_operators = self.w3.catalist_validators.get_catalist_node_operators(blockstamp)
 
         for operator in node_operators:
@@ -160,16 +184,12 @@ class CatalistValidatorStateService:
     def get_exited_catalist_validators(self, blockstamp: ReferenceBlockStamp) -> dict[NodeOperatorGlobalIndex, int]:
         catalist_validators = self.w3.catalist_validators.get_catalist_validators_by_node_operators(blockstamp)
 
-        result = {}
+        ref_epoch = blockstamp.ref_epoch
 
-        for global_no_index in catalist_validators.keys():
-            result[global_no_index] = reduce(
-                lambda total, validator: total + int(is_exited_validator(validator, blockstamp.ref_epoch)),
-                catalist_validators[global_no_index],
-                0,
-            )
-
-        return result
+        return {
+            global_no_index: count_exited_validators(validators, ref_epoch)
+            for global_no_index, validators in catalist_validators.items()
+        }
 
     def get_oracle_report_limits(self, blockstamp: BlockStamp) -> OracleReportLimits:
         result = self.w3.catalist_contracts.oracle_report_sanity_checker.functions.getOracleReportLimits().call(
@@ -205,51 +225,68 @@ class CatalistValidatorStateService:
             blockstamp, chain_config, catalist_validators_by_operator.keys()
         )
 
+        delayed_timeout_in_epoch = self.get_validator_delayed_timeout_in_slot(blockstamp) // chain_config.slots_per_epoch
+        eligible_to_exit_epoch = EpochNumber(blockstamp.ref_epoch - delayed_timeout_in_epoch)
+
         validators_recently_requested_to_exit = []
 
         for global_index, validators in catalist_validators_by_operator.items():
+            last_requested_to_exit_index = ejected_indexes[global_index]
+            recently_requested_to_exit_indexes = recent_indexes[global_index]
 
-            def validator_requested_to_exit(validator: CatalistValidator) -> bool:
-                return int(validator.index) <= ejected_indexes[global_index]
-
-            def validator_recently_requested_to_exit(validator: CatalistValidator) -> bool:
-                return int(validator.index) in recent_indexes[global_index]
-
-            def validator_eligible_to_exit(validator: CatalistValidator) -> bool:
-                delayed_timeout_in_epoch = self.get_validator_delayed_timeout_in_slot(blockstamp) // chain_config.slots_per_epoch
-                return is_validator_eligible_to_exit(validator, EpochNumber(blockstamp.ref_epoch - delayed_timeout_in_epoch))
+            delayed_validators_count = 0
 
-            def is_validator_recently_requested_but_not_exited(validator: CatalistValidator) -> bool:
-                if not validator_requested_to_exit(validator):
-                    return False
+            for validator in validators:
+                if self.is_validator_recently_requested_but_not_exited(
+                    validator,
+                    last_requested_to_exit_index,
+                    recently_requested_to_exit_indexes,
+                    eligible_to_exit_epoch,
+                ):
+                    validators_recently_requested_to_exit.append(validator)
 
-                if is_on_exit(validator):
-                    return False
-
-                if validator_recently_requested_to_exit(validator):
-                    return True
-
-                if not validator_eligible_to_exit(validator):
-                    return True
-
-                return False
-
-            def is_validator_delayed(validator: CatalistValidator) -> bool:
-                return (
-                    validator_requested_to_exit(validator) and
-                    not is_on_exit(validator) and
-                    not validator_recently_requested_to_exit(validator)
-                )
-
-            validators_recently_requested_to_exit.extend(
-                list(filter(is_validator_recently_requested_but_not_exited, validators))
-            )
-            delayed_validators_count = len(list(filter(is_validator_delayed, validators)))
+                if self.is_validator_delayed(validator, last_requested_to_exit_index, recently_requested_to_exit_indexes):
+                    delayed_validators_count += 1
 
             ACCOUNTING_DELAYED_VALIDATORS.labels(*global_index).set(delayed_validators_count)
 
         return validators_recently_requested_to_exit
 
+    @staticmethod
+    def is_validator_recently_requested_but_not_exited(
+        validator: CatalistValidator,
+        last_requested_to_exit_index: int,
+        recently_requested_to_exit_indexes: set[int],
+        eligible_to_exit_epoch: EpochNumber,
+    ) -> bool:
+        """Validator was requested to exit, isn't on exit yet and still has time to do it"""
+        if validator.index > last_requested_to_exit_index:
+            return False
+
+        if is_on_exit(validator):
+            return False
+
+        if validator.index in recently_requested_to_exit_indexes:
+            return True
+
+        if not is_validator_eligible_to_exit(validator, eligible_to_exit_epoch):
+            return True
+
+        return False
+
+    @staticmethod
+    def is_validator_delayed(
+        validator: CatalistValidator,
+        last_requested_to_exit_index: int,
+        recently_requested_to_exit_indexes: set[int],
+    ) -> bool:
+        """Validator was requested to exit not recently and isn't on exit yet"""
+        return (
+            validator.index <= last_requested_to_exit_index and
+            not is_on_exit(validator) and
+            validator.index not in recently_requested_to_exit_indexes
+        )
+
     def get_recently_requests_to_exit_indexes_by_operators(
         self,
         blockstamp: ReferenceBlockStamp,
@@ -273,8 +310,8 @@ class CatalistValidatorStateService:
         }
 
         for event in events:
-            operator_global_index = (event['args']['stakingModuleId'], event['args']['nodeOperatorId'])
-            global_indexes[operator_global_index].add(event['args']['validatorIndex'])
+            args = event['args']
+            global_indexes[(args['stakingModuleId'], args['nodeOperatorId'])].add(args['validatorIndex'])
 
         return global_indexes
 
@@ -1,5 +1,5 @@
 import functools
-from dataclasses import dataclass, fields, is_dataclass
+from dataclasses import Field, dataclass, fields, is_dataclass
 from types import GenericAlias
 from typing import Callable, Self, Sequence, TypeVar
 
@@ -10,14 +10,33 @@ class DecodeToDataclassException(Exception):
     pass
 
 
-@dataclass
+# Dataclass schema never changes after class creation, so fields are collected once per class
+_class_fields_cache: dict[type, tuple[Field, ...]] = {}
+_class_field_names_cache: dict[type, frozenset[str]] = {}
+
+
+def _class_fields(cls: type) -> tuple[Field, ...]:
+    class_fields = _class_fields_cache.get(cls)
+    if class_fields is None:
+        class_fields = _class_fields_cache[cls] = fields(cls)
+    return class_fields
+
+
+def _class_field_names(cls: type) -> frozenset[str]:
+    field_names = _class_field_names_cache.get(cls)
+    if field_names is None:
+        field_names = _class_field_names_cache[cls] = frozenset(field.name for field in _class_fields(cls))
+    return field_names
+
+
+@dataclass(slots=True)
 class Nested:
     """
     Base class for dataclasses that converts all inner dicts into dataclasses
     Also works with lists of dataclasses
     """
     def __post_init__(self):
-        for field in fields(self):
+        for field in _class_fields(type(self)):
             if isinstance(field.type, GenericAlias):
                 field_type = field.type.__args__[0]
                 if is_dataclass(field_type):
@@ -40,7 +59,7 @@ class Nested:
 T = TypeVar('T')
 
 
-@dataclass
+@dataclass(slots=True)
 class FromResponse:
     """
     Class for extending dataclass with custom from_response method, ignored extra fields
@@ -48,7 +67,7 @@ class FromResponse:
 
     @classmethod
     def from_response(cls, **kwargs) -> Self:
-        class_field_names = [field.name for field in fields(cls)]
+        class_field_names = _class_field_names(cls)
         return cls(**{k: v for k, v in kwargs.items() if k in class_field_names})
 
 
@@ -1,4 +1,6 @@
-from typing import Sequence
+from typing import Iterable, Sequence
+
+from more_itertools import ilen
 
 from src.constants import (
     MAX_EFFECTIVE_BALANCE,
@@ -16,21 +18,25 @@ def is_active_validator(validator: Validator, epoch: EpochNumber) -> bool:
     Check if ``validator`` is active.
     https://github.com/ethereum/consensus-specs/blob/dev/specs/phase0/beacon-chain.md#is_active_validator
     """
-    return int(validator.validator.activation_epoch) <= epoch < int(validator.validator.exit_epoch)
+    return validator.validator.activation_epoch <= epoch < validator.validator.exit_epoch
 
 
 def is_exited_validator(validator: Validator, epoch: EpochNumber) -> bool:
-    return int(validator.validator.exit_epoch) <= epoch
+    return validator.validator.exit_epoch <= epoch
+
+
+def count_exited_validators(validators: Iterable[Validator], epoch: EpochNumber) -> int:
+    return ilen(validator for validator in validators if is_exited_validator(validator, epoch))
 
 
 def is_on_exit(validator: Validator) -> bool:
     """Validator exited or is going to exit"""
-    return int(validator.validator.exit_epoch) != FAR_FUTURE_EPOCH
+    return validator.validator.exit_epoch != FAR_FUTURE_EPOCH
 
 
 def get_validator_age(validator: Validator, ref_epoch: EpochNumber) -> int:
     """Validator age in epochs from activation to ref_epoch"""
-    return max(ref_epoch - int(validator.validator.activation_epoch), 0)
+    return max(ref_epoch - validator.validator.activation_epoch, 0)
 
 
 def is_partially_withdrawable_validator(validator: Validator) -> bool:
@@ -38,8 +44,8 @@ def is_partially_withdrawable_validator(validator: Validator) -> bool:
     Check if `validator` is partially withdrawable
     https://github.com/ethereum/consensus-specs/blob/dev/specs/capella/beacon-chain.md#is_partially_withdrawable_validator
     """
-    has_max_effective_balance = int(validator.validator.effective_balance) == MAX_EFFECTIVE_BALANCE
-    has_excess_balance = int(validator.balance) > MAX_EFFECTIVE_BALANCE
+    has_max_effective_balance = validator.validator.effective_balance == MAX_EFFECTIVE_BALANCE
+    has_excess_balance = validator.balance > MAX_EFFECTIVE_BALANCE
     return (
         has_eth1_withdrawal_credential(validator)
         and has_max_effective_balance
@@ -52,7 +58,7 @@ def has_eth1_withdrawal_credential(validator: Validator) -> bool:
     Check if ``validator`` has an 0x01 prefixed "eth1" withdrawal credential.
     https://github.com/ethereum/consensus-specs/blob/dev/specs/capella/beacon-chain.md#has_eth1_withdrawal_credential
     """
-    return validator.validator.withdrawal_credentials[:4] == ETH1_ADDRESS_WITHDRAWAL_PREFIX
+    return validator.validator.withdrawal_credentials.startswith(ETH1_ADDRESS_WITHDRAWAL_PREFIX)
 
 
 def is_fully_withdrawable_validator(validator: Validator, epoch: EpochNumber) -> bool:
@@ -60,10 +66,11 @@ def is_fully_withdrawable_validator(validator: Validator, epoch: EpochNumber) ->
     Check if `validator` is fully withdrawable
     https://github.com/ethereum/consensus-specs/blob/dev/specs/capella/beacon-chain.md#is_fully_withdrawable_validator
     """
+    # Epoch check goes first, it is cheaper and fails for most of active validators
     return (
-        has_eth1_withdrawal_credential(validator)
-        and EpochNumber(int(validator.validator.withdrawable_epoch)) <= epoch
-        and Gwei(int(validator.balance)) > Gwei(0)
+        validator.validator.withdrawable_epoch <= epoch
+        and has_eth1_withdrawal_credential(validator)
+        and validator.balance > 0
     )
 
 
@@ -73,7 +80,7 @@ def is_validator_eligible_to_exit(validator: Validator, epoch: EpochNumber) -> b
     Verify the validator has been active long enough.
     https://github.com/ethereum/consensus-specs/blob/dev/specs/phase0/beacon-chain.md#voluntary-exits
     """
-    active_long_enough = int(validator.validator.activation_epoch) + SHARD_COMMITTEE_PERIOD <= epoch
+    active_long_enough = validator.validator.activation_epoch + SHARD_COMMITTEE_PERIOD <= epoch
     return active_long_enough and not is_on_exit(validator)
 
 
@@ -91,10 +98,8 @@ def calculate_active_effective_balance_sum(validators: Sequence[Validator], ref_
     """
     Return the combined effective balance of the active validators from the given list
     """
-    effective_balance_sum = 0
-
-    for validator in validators:
-        if is_active_validator(validator, ref_epoch):
-            effective_balance_sum += int(validator.validator.effective_balance)
-
-    return Gwei(effective_balance_sum)
+    return Gwei(sum(
+        validator.validator.effective_balance
+        for validator in validators
+        if is_active_validator(validator, ref_epoch)
+    ))
@@ -1,6 +1,7 @@
 import logging
-from dataclasses import asdict, dataclass
-from typing import TYPE_CHECKING, NewType, Tuple
+from dataclasses import dataclass, fields
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping, NewType, Self, Sequence, Tuple
 
 from eth_typing import ChecksumAddress
 from web3.module import Module
@@ -24,7 +25,7 @@ NodeOperatorId = NewType('NodeOperatorId', int)
 NodeOperatorGlobalIndex = Tuple[StakingModuleId, NodeOperatorId]
 
 
-@dataclass
+@dataclass(slots=True)
 class StakingModule:
     # unique id of the staking module
     id: StakingModuleId
@@ -49,7 +50,7 @@ class StakingModule:
     exited_validators_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeOperator(Nested):
     id: NodeOperatorId
     is_active: bool
@@ -91,22 +92,34 @@ class NodeOperator(Nested):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CatalistValidator(Validator):
     catalist_id: CatalistKey
 
+    @classmethod
+    def from_validator(cls, validator: Validator, catalist_id: CatalistKey) -> Self:
+        return cls(
+            **{field.name: getattr(validator, field.name) for field in fields(Validator)},
+            catalist_id=catalist_id,
+        )
+
 
 class CountOfKeysDiffersException(Exception):
     pass
 
 
-ValidatorsByNodeOperator = dict[NodeOperatorGlobalIndex, list[CatalistValidator]]
+# Result is shared between services through the cache, so it is read-only
+ValidatorsByNodeOperator = Mapping[NodeOperatorGlobalIndex, Sequence[CatalistValidator]]
 
 
 class CatalistValidatorsProvider(Module):
+    """
+    Catalist validators, node operators and staking modules are cached for two blockstamps,
+    because reports and safe border calculations alternate between the reference blockstamp and a past one.
+    """
     w3: 'Web3'
 
-    @lru_cache(maxsize=1)
+    @lru_cache(maxsize=2)
     def get_catalist_validators(self, blockstamp: BlockStamp) -> list[CatalistValidator]:
         catalist_keys = self.w3.kac.get_used_catalist_keys(blockstamp)
         validators = self.w3.cc.get_validators(blockstamp)
@@ -127,51 +140,59 @@ class CatalistValidatorsProvider(Module):
     @staticmethod
     def merge_validators_with_keys(keys: list[CatalistKey], validators: list[Validator]) -> list[CatalistValidator]:
         """Merging and filter non-catalist validators."""
-        validators_keys_dict = {validator.validator.pubkey: validator for validator in validators}
-
-        catalist_validators = []
-
-        for key in keys:
-            if key.key in validators_keys_dict:
-                catalist_validators.append(CatalistValidator(
-                    catalist_id=key,
-                    **asdict(validators_keys_dict[key.key]),
-                ))
+        catalist_pubkeys = {key.key for key in keys}
+        validators_keys_dict = {
+            validator.validator.pubkey: validator
+            for validator in validators
+            if validator.validator.pubkey in catalist_pubkeys
+        }
 
-        return catalist_validators
+        return [
+            CatalistValidator.from_validator(validator, key)
+            for key in keys
+            if (validator := validators_keys_dict.get(key.key)) is not None
+        ]
 
-    @lru_cache(maxsize=1)
+    @lru_cache(maxsize=2)
     def get_catalist_validators_by_node_operators(self, blockstamp: BlockStamp) -> ValidatorsByNodeOperator:
         merged_validators = self.get_catalist_validators(blockstamp)
         no_operators = self.get_catalist_node_operators(blockstamp)
 
-        # Make sure even empty NO will be presented in dict
-        no_validators: ValidatorsByNodeOperator = {
-            (operator.staking_module.id, operator.id): [] for operator in no_operators
-        }
+        no_validators: dict[NodeOperatorGlobalIndex, list[CatalistValidator]] = {}
+        # Same lists as in no_validators, but reachable straight from key fields without building global index
+        module_operators_validators: dict[ChecksumAddress, dict[int, list[CatalistValidator]]] = {}
+        staking_module_address: dict[ChecksumAddress, StakingModuleId] = {}
 
-        staking_module_address = {
-            operator.staking_module.staking_module_address: operator.staking_module.id
-            for operator in no_operators
-        }
+        # Single pass over operators. Make sure even empty NO will be presented in dict
+        for operator in no_operators:
+            operator_validators: list[CatalistValidator] = []
+            no_validators[(operator.staking_module.id, operator.id)] = operator_validators
+            module_address = operator.staking_module.staking_module_address
+            module_operators_validators.setdefault(module_address, {})[operator.id] = operator_validators
+            staking_module_address[module_address] = operator.staking_module.id
 
         for validator in merged_validators:
-            global_no_id = (
-                staking_module_address[validator.catalist_id.moduleAddress],
-                NodeOperatorId(validator.catalist_id.operatorIndex),
-            )
+            catalist_id = validator.catalist_id
+            bucket = module_operators_validators[catalist_id.moduleAddress].get(catalist_id.operatorIndex)
 
-            if global_no_id in no_validators:
-                no_validators[global_no_id].append(validator)
+            if bucket is not None:
+                bucket.append(validator)
             else:
+                global_no_id = (
+                    staking_module_address[catalist_id.moduleAddress],
+                    NodeOperatorId(catalist_id.operatorIndex),
+                )
                 logger.warning({
                     'msg': f'Got global node operator id: {global_no_id}, '
                            f'but it`s not exist in staking router on block number: {blockstamp.block_number}',
                 })
 
-        return no_validators
+        return MappingProxyType({
+            global_no_id: tuple(operator_validators)
+            for global_no_id, operator_validators in no_validators.items()
+        })
 
-    @lru_cache(maxsize=1)
+    @lru_cache(maxsize=2)
     def get_catalist_node_operators(self, blockstamp: BlockStamp) -> list[NodeOperator]:
         result = []
 
@@ -185,7 +206,7 @@ class CatalistValidatorsProvider(Module):
 
         return result
 
-    @lru_cache(maxsize=1)
+    @lru_cache(maxsize=2)
     @list_of_dataclasses(StakingModule)
     def get_staking_modules(self, blockstamp: BlockStamp) -> list[StakingModule]:
         modules = self.w3.catalist_contracts.staking_router.functions.getStakingModules().call(
@@ -1,4 +1,6 @@
 import random
+from dataclasses import replace
+from functools import cache
 from itertools import count
 
 from faker import Faker
@@ -20,6 +22,21 @@ class ValidatorStateFactory(Web3Factory):
 class ValidatorFactory(Web3Factory):
     __model__ = Validator
 
+    @classmethod
+    @cache
+    def _prototype(cls) -> Validator:
+        return cls.build()
+
+    @classmethod
+    def build_fast(cls) -> Validator:
+        """
+        Copy of one random validator generated once per process. Faker generation is slow,
+        use it in tests that set all meaningful fields themselves.
+        Every result gets its own ValidatorState, so mutations never leak into the cached prototype or other results.
+        """
+        prototype = cls._prototype()
+        return replace(prototype, validator=replace(prototype.validator))
+
 
 class CatalistKeyFactory(Web3Factory):
     __model__ = CatalistKey
@@ -41,8 +58,8 @@ class StakingModuleFactory(Web3Factory):
 class CatalistValidatorFactory(Web3Factory):
     __model__ = CatalistValidator
 
-    index: str = Use(lambda x: str(next(x)), count(1))
-    balance: str = Use(lambda x: str(x), random.randrange(1, 10**9))
+    index: int = Use(lambda x: next(x), count(1))
+    balance: int = Use(random.randrange, 1, 10**9)
 
 
 class NodeOperatorFactory(Web3Factory):
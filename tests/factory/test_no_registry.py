@@ -0,0 +1,17 @@
+import pytest
+
+from tests.factory.no_registry import ValidatorFactory
+
+
+@pytest.mark.unit
+def test_validator_build_fast_does_not_share_state():
+    first = ValidatorFactory.build_fast()
+    balance, exit_epoch = first.balance, first.validator.exit_epoch
+
+    first.balance = balance + 1
+    first.validator.exit_epoch = exit_epoch + 1
+    second = ValidatorFactory.build_fast()
+
+    assert second.validator is not first.validator
+    assert second.balance == balance
+    assert second.validator.exit_epoch == exit_epoch
@@ -2,6 +2,7 @@ from unittest.mock import Mock
 
 import pytest
 
+from src.constants import FAR_FUTURE_EPOCH
 from src.modules.submodules.typings import ChainConfig
 from src.providers.consensus.typings import Validator, ValidatorStatus, ValidatorState
 from src.services.bunker import BunkerService
@@ -25,18 +26,18 @@ def simple_key(pubkey: str) -> CatalistKey:
     return key
 
 
-def simple_validator(index, pubkey, balance, slashed=False, withdrawable_epoch='', exit_epoch='100500') -> Validator:
+def simple_validator(index, pubkey, balance, slashed=False, withdrawable_epoch=FAR_FUTURE_EPOCH, exit_epoch=100500) -> Validator:
     return Validator(
-        index=str(index),
-        balance=str(balance),
+        index=index,
+        balance=balance,
         status=ValidatorStatus.ACTIVE_ONGOING,
         validator=ValidatorState(
             pubkey=pubkey,
             withdrawal_credentials='',
-            effective_balance=str(32 * 10**9),
+            effective_balance=32 * 10**9,
             slashed=slashed,
-            activation_eligibility_epoch='',
-            activation_epoch='0',
+            activation_eligibility_epoch=0,
+            activation_epoch=0,
             exit_epoch=exit_epoch,
             withdrawable_epoch=withdrawable_epoch,
         ),
@@ -215,18 +216,18 @@ def mock_get_validators(web3):
                 simple_validator(0, '0x00', 32 * 10**9),
                 simple_validator(1, '0x01', 32 * 10**9),
                 simple_validator(2, '0x02', 32 * 10**9),
-                simple_validator(3, '0x03', 32 * 10**9, slashed=True, withdrawable_epoch='10001'),
-                simple_validator(4, '0x04', 32 * 10**9, slashed=True, withdrawable_epoch='10001'),
-                simple_validator(5, '0x05', 32 * 10**9, slashed=True, withdrawable_epoch='10001'),
+                simple_validator(3, '0x03', 32 * 10**9, slashed=True, withdrawable_epoch=10001),
+                simple_validator(4, '0x04', 32 * 10**9, slashed=True, withdrawable_epoch=10001),
+                simple_validator(5, '0x05', 32 * 10**9, slashed=True, withdrawable_epoch=10001),
                 *[simple_validator(i, f'0x0{i}', 32 * 10**9) for i in range(6, 200)],
             ],
             123: [
-                simple_validator(0, '0x00', 32 * 10**9, exit_epoch='1'),
-                simple_validator(1, '0x01', 32 * 10**9, exit_epoch='1'),
-                simple_validator(2, '0x02', 32 * 10**9, exit_epoch='1'),
-                simple_validator(3, '0x03', 32 * 10**9, exit_epoch='1'),
-                simple_validator(4, '0x04', 32 * 10**9, exit_epoch='1'),
-                simple_validator(5, '0x05', 32 * 10**9, exit_epoch='1'),
+                simple_validator(0, '0x00', 32 * 10**9, exit_epoch=1),
+                simple_validator(1, '0x01', 32 * 10**9, exit_epoch=1),
+                simple_validator(2, '0x02', 32 * 10**9, exit_epoch=1),
+                simple_validator(3, '0x03', 32 * 10**9, exit_epoch=1),
+                simple_validator(4, '0x04', 32 * 10**9, exit_epoch=1),
+                simple_validator(5, '0x05', 32 * 10**9, exit_epoch=1),
             ],
         }
         return validators[state.slot_number]
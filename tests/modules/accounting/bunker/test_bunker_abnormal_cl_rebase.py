@@ -10,28 +10,18 @@ from tests.modules.accounting.bunker.conftest import simple_ref_blockstamp, simp
 def simple_validators(
     from_index: int,
     to_index: int,
-    balance=str(32 * 10**9),
-    effective_balance=str(32 * 10**9),
+    balance=32 * 10**9,
+    effective_balance=32 * 10**9,
 ) -> list[Validator]:
-    validators = []
-    for index in range(from_index, to_index + 1):
-        validator = Validator(
-            index=str(index),
-            balance=balance,
-            status=ValidatorStatus.ACTIVE_ONGOING,
-            validator=ValidatorState(
-                pubkey=f"0x{index}",
-                withdrawal_credentials='',
-                effective_balance=effective_balance,
-                slashed=False,
-                activation_eligibility_epoch='',
-                activation_epoch='0',
-                exit_epoch=FAR_FUTURE_EPOCH,
-                withdrawable_epoch=FAR_FUTURE_EPOCH,
-            ),
+    return [
+        Validator(
+            index,
+            balance,
+            ValidatorStatus.ACTIVE_ONGOING,
+            ValidatorState(f"0x{index}", '', effective_balance, False, 0, 0, FAR_FUTURE_EPOCH, FAR_FUTURE_EPOCH),
         )
-        validators.append(validator)
-    return validators
+        for index in range(from_index, to_index + 1)
+    ]
 
 
 @pytest.mark.unit
@@ -336,10 +326,10 @@ def test_validate_slot_distance(distant_slot, nearest_slot, ref_slot, expected_r
         ([], 0),
         (simple_validators(0, 9), 10 * 32 * 10**9),
         (
-            simple_validators(0, 9, balance=str(int(31.75 * 10**9)), effective_balance=str(32 * 10**9)),
+            simple_validators(0, 9, balance=int(31.75 * 10**9), effective_balance=32 * 10**9),
             10 * int(31.75 * 10**9),
         ),
-        (simple_validators(0, 9, balance=str(10**9)), 10 * 10**9),
+        (simple_validators(0, 9, balance=10**9), 10 * 10**9),
     ],
 )
 def test_calculate_real_balance(validators, expected_balance):
@@ -17,23 +17,23 @@ def simple_validators(
     from_index: int,
     to_index: int,
     slashed=False,
-    withdrawable_epoch="8192",
-    exit_epoch="7892",
-    effective_balance=str(32 * 10**9),
+    withdrawable_epoch=8192,
+    exit_epoch=7892,
+    effective_balance=32 * 10**9,
 ) -> list[Validator]:
     validators = []
     for index in range(from_index, to_index + 1):
         validator = Validator(
-            index=str(index),
+            index=index,
             balance=effective_balance,
             status=ValidatorStatus.ACTIVE_ONGOING,
             validator=ValidatorState(
                 pubkey=f"0x{index}",
                 withdrawal_credentials='',
-                effective_balance=str(32 * 10**9),
+                effective_balance=32 * 10**9,
                 slashed=slashed,
-                activation_eligibility_epoch='',
-                activation_epoch='0',
+                activation_eligibility_epoch=0,
+                activation_epoch=0,
                 exit_epoch=exit_epoch,
                 withdrawable_epoch=withdrawable_epoch,
             ),
@@ -67,9 +67,9 @@ def simple_validators(
             simple_blockstamp(1500000),
             [
                 *simple_validators(0, 49),
-                *simple_validators(50, 99, slashed=True, exit_epoch="16084", withdrawable_epoch="16384"),
+                *simple_validators(50, 99, slashed=True, exit_epoch=16084, withdrawable_epoch=16384),
             ],
-            simple_validators(50, 99, slashed=True, exit_epoch="16084", withdrawable_epoch="16384"),
+            simple_validators(50, 99, slashed=True, exit_epoch=16084, withdrawable_epoch=16384),
             0,
             False,
         ),
@@ -135,19 +135,19 @@ def test_is_high_midterm_slashing_penalty(
         (simple_validators(0, 0, slashed=True)[0], EpochNumber(225), [0]),
         # slashing epoch is not first epoch and it's determined
         (
-            simple_validators(0, 0, slashed=True, exit_epoch="16084", withdrawable_epoch="16384")[0],
+            simple_validators(0, 0, slashed=True, exit_epoch=16084, withdrawable_epoch=16384)[0],
             EpochNumber(225),
             [8192],
         ),
         # slashing epoch is not determined
         (
-            simple_validators(0, 0, slashed=True, exit_epoch="16380", withdrawable_epoch="16384")[0],
+            simple_validators(0, 0, slashed=True, exit_epoch=16380, withdrawable_epoch=16384)[0],
             EpochNumber(225),
             list(range(226)),
         ),
         # slashing epoch is not determined and ref epoch is not last epoch in first frame
         (
-            simple_validators(0, 0, slashed=True, exit_epoch="16380", withdrawable_epoch="16384")[0],
+            simple_validators(0, 0, slashed=True, exit_epoch=16380, withdrawable_epoch=16384)[0],
             EpochNumber(16000),
             list(range(7808, 8193)),
         ),
@@ -181,11 +181,11 @@ def test_get_possible_slashed_epochs(validator, ref_epoch, expected_result):
             225,
             [
                 *simple_validators(0, 9, slashed=True),
-                *simple_validators(10, 59, slashed=True, withdrawable_epoch="8417"),
+                *simple_validators(10, 59, slashed=True, withdrawable_epoch=8417),
             ],
             {
                 18: simple_validators(0, 9, slashed=True),
-                19: simple_validators(10, 59, slashed=True, withdrawable_epoch="8417"),
+                19: simple_validators(10, 59, slashed=True, withdrawable_epoch=8417),
             },
         ),
     ],
@@ -234,11 +234,11 @@ def test_get_per_frame_catalist_validators_with_future_midterm_epoch(
             225,
             {
                 18: simple_validators(0, 9, slashed=True),
-                19: simple_validators(10, 59, slashed=True, exit_epoch="8000", withdrawable_epoch="8417"),
+                19: simple_validators(10, 59, slashed=True, exit_epoch=8000, withdrawable_epoch=8417),
             },
             [
                 *simple_validators(0, 9, slashed=True),
-                *simple_validators(10, 59, slashed=True, exit_epoch="8000", withdrawable_epoch="8417"),
+                *simple_validators(10, 59, slashed=True, exit_epoch=8000, withdrawable_epoch=8417),
             ],
             100,
             {18: 10 * 32 * 10**9, 19: 50 * 32 * 10**9},
@@ -249,18 +249,18 @@ def test_get_per_frame_catalist_validators_with_future_midterm_epoch(
             {
                 18: [
                     *simple_validators(0, 5),
-                    *simple_validators(6, 9, slashed=True, exit_epoch="8192", withdrawable_epoch="8197"),
+                    *simple_validators(6, 9, slashed=True, exit_epoch=8192, withdrawable_epoch=8197),
                 ],
                 19: [
-                    *simple_validators(10, 29, slashed=True, exit_epoch="8000", withdrawable_epoch="8417"),
-                    *simple_validators(30, 59, slashed=True, exit_epoch="8417", withdrawable_epoch="8419"),
+                    *simple_validators(10, 29, slashed=True, exit_epoch=8000, withdrawable_epoch=8417),
+                    *simple_validators(30, 59, slashed=True, exit_epoch=8417, withdrawable_epoch=8419),
                 ],
             },
             [
                 *simple_validators(0, 5),
-                *simple_validators(6, 9, slashed=True, exit_epoch="8192", withdrawable_epoch="8197"),
-                *simple_validators(10, 29, slashed=True, exit_epoch="8000", withdrawable_epoch="8417"),
-                *simple_validators(30, 59, slashed=True, exit_epoch="8417", withdrawable_epoch="8419"),
+                *simple_validators(6, 9, slashed=True, exit_epoch=8192, withdrawable_epoch=8197),
+                *simple_validators(10, 29, slashed=True, exit_epoch=8000, withdrawable_epoch=8417),
+                *simple_validators(30, 59, slashed=True, exit_epoch=8417, withdrawable_epoch=8419),
             ],
             100,
             {18: 10 * 32 * 10**9, 19: 50 * 32 * 10**9},
@@ -311,12 +311,12 @@ def test_get_future_midterm_penalty_sum_in_frames(
             225,
             [
                 *simple_validators(0, 5, slashed=True),
-                *simple_validators(6, 9, slashed=True, exit_epoch="8192", withdrawable_epoch="8197"),
+                *simple_validators(6, 9, slashed=True, exit_epoch=8192, withdrawable_epoch=8197),
             ],
             100 * 32 * 10**9,
             [
                 *simple_validators(0, 5, slashed=True),
-                *simple_validators(6, 9, slashed=True, exit_epoch="8192", withdrawable_epoch="8197"),
+                *simple_validators(6, 9, slashed=True, exit_epoch=8192, withdrawable_epoch=8197),
             ],
             10 * 9 * 10**9,
         ),
@@ -367,9 +367,9 @@ def test_get_midterm_penalty(bounded_slashings_count, active_validators_count, e
         (
             # slashing epoch is not determined
             EpochNumber(16000),
-            simple_validators(0, 0, exit_epoch="16380", withdrawable_epoch="16384"),
+            simple_validators(0, 0, exit_epoch=16380, withdrawable_epoch=16384),
             12288,
-            simple_validators(0, 0, exit_epoch="16380", withdrawable_epoch="16384"),
+            simple_validators(0, 0, exit_epoch=16380, withdrawable_epoch=16384),
         ),
     ],
 )
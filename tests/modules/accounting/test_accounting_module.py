@@ -104,7 +104,7 @@ def test_get_consensus_catalist_state(accounting: Accounting):
     count, balance = accounting._get_consensus_catalist_state(bs)
 
     assert count == 10
-    assert balance == sum((int(val.balance) for val in validators))
+    assert balance == sum((val.balance for val in validators))
 
 
 @pytest.mark.unit
@@ -3,8 +3,10 @@ from unittest.mock import Mock
 
 import pytest
 from eth_typing import HexStr
+from hexbytes import HexBytes
 
 from src.constants import FAR_FUTURE_EPOCH
+from src.metrics.prometheus.accounting import ACCOUNTING_DELAYED_VALIDATORS
 from src.services.validator_state import CatalistValidatorStateService
 from src.modules.submodules.typings import ChainConfig
 from src.providers.consensus.typings import Validator, ValidatorState
@@ -47,18 +49,18 @@ class MockValidatorsProvider(CatalistValidatorsProvider):
                 ),
                 **asdict(
                     Validator(
-                        index=str(index),
-                        balance="0",
+                        index=index,
+                        balance=0,
                         status="",
                         validator=ValidatorState(
                             pubkey=pubkey,
                             withdrawal_credentials="0x1",
-                            effective_balance="0",
+                            effective_balance=0,
                             slashed=False,
-                            activation_eligibility_epoch="0",
-                            activation_epoch=str(activation_epoch),
-                            exit_epoch=str(exit_epoch),
-                            withdrawable_epoch="0",
+                            activation_eligibility_epoch=0,
+                            activation_epoch=activation_epoch,
+                            exit_epoch=exit_epoch,
+                            withdrawable_epoch=0,
                         ),
                     )
                 ),
@@ -140,7 +142,7 @@ def chain_config():
 
 
 def test_get_catalist_new_stuck_validators(web3, validator_state, chain_config):
-    validator_state.get_last_requested_to_exit_pubkeys = Mock(return_value={"0x8"})
+    validator_state.get_last_requested_to_exit_pubkeys = Mock(return_value=frozenset([HexBytes("0x8")]))
     validator_state.get_validator_delinquent_timeout_in_slot = Mock(return_value=0)
     stuck_validators = validator_state.get_catalist_newly_stuck_validators(blockstamp, chain_config)
     assert stuck_validators == {(1, 0): 1}
@@ -157,3 +159,112 @@ def test_get_catalist_new_exited_validators(web3, validator_state):
     exited_validators = validator_state.get_catalist_newly_exited_validators(blockstamp)
     # We didn't expect the second validator because total_exited_validators hasn't changed
     assert exited_validators == {(1, 0): 3}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'last_requested_to_exit_index, recently_requested_to_exit_pubkeys, ref_slot, expected_result',
+    [
+        (8, set(), 9024, 2),
+        (4, set(), 9024, 1),
+        (8, {HexBytes('0x1'), HexBytes('0x8')}, 9024, 0),
+        (8, set(), 256 * 32, 0),
+    ],
+)
+def test_count_operator_stuck_validators(
+    web3,
+    catalist_validators,
+    last_requested_to_exit_index,
+    recently_requested_to_exit_pubkeys,
+    ref_slot,
+    expected_result,
+):
+    validators = [
+        validator
+        for validators in web3.catalist_validators.get_catalist_validators_by_node_operators(blockstamp).values()
+        for validator in validators
+        if validator.validator.activation_epoch == 0
+    ]
+
+    result = CatalistValidatorStateService.count_operator_stuck_validators(
+        validators,
+        last_requested_to_exit_index,
+        recently_requested_to_exit_pubkeys,
+        ref_slot,
+        32,
+        0,
+    )
+
+    assert result == expected_result
+
+
+@pytest.mark.unit
+def test_get_operators_with_last_exited_validator_indexes_skips_empty_modules(web3, validator_state):
+    module = web3.catalist_validators.get_staking_modules(blockstamp)[0]
+    empty_module = StakingModule(**{**asdict(module), 'id': 2})
+    web3.catalist_validators.get_staking_modules = Mock(return_value=[module, empty_module])
+
+    indexes = validator_state.get_operators_with_last_exited_validator_indexes(blockstamp)
+
+    assert indexes == {(1, 0): 3, (1, 1): 8}
+    validator_state._get_last_requested_validator_indices.assert_called_once_with(blockstamp, module, [0, 1])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("ref_epoch", "delayed_timeout_in_slots", "expected_indexes"),
+    [
+        # Nobody passed SHARD_COMMITTEE_PERIOD yet
+        (TESTING_REF_EPOCH, 0, [1, 5, 6, 8]),
+        # Validator 1 is eligible to exit since epoch 256 and its timeout (10 epochs) has passed
+        (400, 10 * 32, [5, 6, 8]),
+        # Timeout is 145 epochs, so validator 1 still has time to exit
+        (400, 145 * 32, [1, 5, 6, 8]),
+    ],
+)
+def test_get_recently_requested_but_not_exited_validators(
+    web3,
+    validator_state,
+    chain_config,
+    ref_epoch,
+    delayed_timeout_in_slots,
+    expected_indexes,
+):
+    validator_state.get_recently_requests_to_exit_indexes_by_operators = Mock(
+        return_value={(1, 0): set(), (1, 1): {8}}
+    )
+    validator_state.get_validator_delayed_timeout_in_slot = Mock(return_value=delayed_timeout_in_slots)
+    ACCOUNTING_DELAYED_VALIDATORS.clear()
+
+    validators = validator_state.get_recently_requested_but_not_exited_validators(
+        ReferenceBlockStampFactory.build(ref_epoch=ref_epoch),
+        chain_config,
+    )
+
+    assert [v.index for v in validators] == expected_indexes
+    delayed_validators = {
+        (sample.labels['module_id'], sample.labels['no_id']): sample.value
+        for sample in ACCOUNTING_DELAYED_VALIDATORS.collect()[0].samples
+    }
+    # Validator 8 was requested recently and 7 is already on exit
+    assert delayed_validators == {('1', '0'): 1, ('1', '1'): 2}
+
+
+@pytest.mark.unit
+def test_get_extra_data(web3, validator_state, chain_config):
+    validator_state.get_catalist_newly_stuck_validators = Mock(return_value={(1, 0): 1})
+    validator_state.get_catalist_newly_exited_validators = Mock(return_value={(1, 0): 3})
+    validator_state.get_oracle_report_limits = Mock(
+        return_value=Mock(max_accounting_extra_data_list_items_count=2, max_node_operators_per_extra_data_item_count=1)
+    )
+    validator_state.extra_data_service.collect = Mock(return_value='extra_data')
+
+    assert validator_state.get_extra_data(blockstamp, chain_config) == 'extra_data'
+
+    validator_state.get_catalist_newly_stuck_validators.assert_called_once_with(blockstamp, chain_config)
+    validator_state.extra_data_service.collect.assert_called_once_with(
+        stuck_validators={(1, 0): 1},
+        exited_validators={(1, 0): 3},
+        max_items_count=2,
+        max_no_in_payload_count=1,
+    )
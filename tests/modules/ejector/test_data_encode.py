@@ -43,7 +43,7 @@ def pubkey_factory() -> Callable:
 @pytest.fixture()
 def validator_factory(pubkey_factory: Callable[[], str]) -> Callable:
     def _factory(index: int, pubkey: str | None = None):
-        v = CatalistValidatorFactory.build(index=str(index))
+        v = CatalistValidatorFactory.build(index=index)
         v.validator.pubkey = pubkey or pubkey_factory()
         return v
 
@@ -88,7 +88,7 @@ def test_encode_data(validator_factory: Callable[..., CatalistValidator]) -> Non
 
         assert int.from_bytes(chunks[0]) == _module_id, "Module ID mismatch"
         assert int.from_bytes(chunks[1]) == _nop_id, "Node operator ID mismatch"
-        assert int.from_bytes(chunks[2]) == int(_val.index), "Validator's index mismatch"
+        assert int.from_bytes(chunks[2]) == _val.index, "Validator's index mismatch"
         assert chunks[3] == bytes.fromhex(_val.validator.pubkey[2:]), "Pubkey mismatch"
 
 
@@ -277,5 +277,5 @@ def test_validators_sorting_for_ejector_report(validators_to_eject):
             last_no_id = global_index[1]
             last_validator_index = -1
 
-        assert int(validator.index) > last_validator_index
-        last_validator_index = int(validator.index)
+        assert validator.index > last_validator_index
+        last_validator_index = validator.index
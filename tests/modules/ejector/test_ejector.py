@@ -210,10 +210,10 @@ def test_get_withdrawable_catalist_validators(
 ) -> None:
     ejector.w3.catalist_validators.get_catalist_validators = Mock(
         return_value=[
-            CatalistValidatorFactory.build(balance="0"),
-            CatalistValidatorFactory.build(balance="0"),
-            CatalistValidatorFactory.build(balance="31"),
-            CatalistValidatorFactory.build(balance="42"),
+            CatalistValidatorFactory.build(balance=0),
+            CatalistValidatorFactory.build(balance=0),
+            CatalistValidatorFactory.build(balance=31),
+            CatalistValidatorFactory.build(balance=42),
         ]
     )
 
@@ -221,7 +221,7 @@ def test_get_withdrawable_catalist_validators(
         m.setattr(
             ejector_module,
             "is_fully_withdrawable_validator",
-            Mock(side_effect=lambda v, _: int(v.balance) > 32),
+            Mock(side_effect=lambda v, _: v.balance > 32),
         )
 
         result = ejector._get_withdrawable_catalist_validators_balance(ref_blockstamp, 42)
@@ -233,15 +233,15 @@ def test_get_withdrawable_catalist_validators(
 
 @pytest.mark.unit
 def test_get_predicted_withdrawable_balance(ejector: Ejector) -> None:
-    validator = CatalistValidatorFactory.build(balance="0")
+    validator = CatalistValidatorFactory.build(balance=0)
     result = ejector._get_predicted_withdrawable_balance(validator)
     assert result == 0, "Expected zero"
 
-    validator = CatalistValidatorFactory.build(balance="42")
+    validator = CatalistValidatorFactory.build(balance=42)
     result = ejector._get_predicted_withdrawable_balance(validator)
     assert result == 42 * 10**9, "Expected validator's balance in gwei"
 
-    validator = CatalistValidatorFactory.build(balance=str(MAX_EFFECTIVE_BALANCE + 1))
+    validator = CatalistValidatorFactory.build(balance=MAX_EFFECTIVE_BALANCE + 1)
     result = ejector._get_predicted_withdrawable_balance(validator)
     assert result == MAX_EFFECTIVE_BALANCE * 10**9, "Expect MAX_EFFECTIVE_BALANCE"
 
@@ -1,3 +1,4 @@
+from itertools import chain
 from unittest.mock import Mock
 
 import pytest
@@ -20,25 +21,16 @@ TESTING_VALIDATOR_DELAYED_TIMEOUT_IN_SLOTS = 10
 def simple_validators(
     from_index: int, to_index: int, slashed=False, activation_epoch=0, exit_epoch=FAR_FUTURE_EPOCH
 ) -> list[Validator]:
-    validators = []
-    for index in range(from_index, to_index + 1):
-        validator = Validator(
-            index=str(index),
-            balance=str(32 * 10**9),
-            status=ValidatorStatus.ACTIVE_ONGOING,
-            validator=ValidatorState(
-                pubkey=f"0x{index}",
-                withdrawal_credentials='',
-                effective_balance=str(32 * 10**9),
-                slashed=slashed,
-                activation_eligibility_epoch='',
-                activation_epoch=str(activation_epoch),
-                exit_epoch=exit_epoch,
-                withdrawable_epoch=exit_epoch,
-            ),
+    balance = 32 * 10**9
+    return [
+        Validator(
+            index,
+            balance,
+            ValidatorStatus.ACTIVE_ONGOING,
+            ValidatorState(f"0x{index}", '', balance, slashed, 0, activation_epoch, exit_epoch, exit_epoch),
         )
-        validators.append(validator)
-    return validators
+        for index in range(from_index, to_index + 1)
+    ]
 
 
 def simple_operator(
@@ -71,10 +63,10 @@ def mock_get_validators(exit_order_state):
     def _get_validators(blockstamp):
         responses = {
             100: simple_validators(0, 19),
-            200: [
-                *simple_validators(0, 9, exit_epoch=100500),
-                *simple_validators(10, 19),
-            ],
+            200: list(chain(
+                simple_validators(0, 9, exit_epoch=100500),
+                simple_validators(10, 19),
+            )),
         }
 
         return responses[blockstamp.slot_number]
@@ -162,10 +154,10 @@ def test_get_exitable_catalist_validators(
     exit_order_state._operator_validators = {
         (0, 0): simple_validators(0, 9),
         (0, 1): simple_validators(10, 19),
-        (1, 1): [
-            *simple_validators(20, 24),
-            *simple_validators(25, 29, exit_epoch=100500),
-        ],
+        (1, 1): list(chain(
+            simple_validators(20, 24),
+            simple_validators(25, 29, exit_epoch=100500),
+        )),
         (1, 2): simple_validators(30, 39, activation_epoch=1),
     }
     exit_order_state._operator_last_requested_to_exit_indexes = {
@@ -177,10 +169,10 @@ def test_get_exitable_catalist_validators(
 
     result = exit_order_state.get_exitable_catalist_validators()
 
-    assert result == [
-        *simple_validators(12, 19),
-        *simple_validators(30, 39, activation_epoch=1),
-    ]
+    assert result == list(chain(
+        simple_validators(12, 19),
+        simple_validators(30, 39, activation_epoch=1),
+    ))
 
 
 @pytest.mark.unit
@@ -272,10 +264,10 @@ def test_prepare_catalist_node_operator_stats(
     exit_order_state._operator_validators = {
         (0, 0): simple_validators(0, 9),
         (0, 1): simple_validators(10, 19),
-        (1, 1): [
-            *simple_validators(20, 24),
-            *simple_validators(25, 29, exit_epoch=100500),
-        ],
+        (1, 1): list(chain(
+            simple_validators(20, 24),
+            simple_validators(25, 29, exit_epoch=100500),
+        )),
         (1, 2): simple_validators(30, 39, activation_epoch=1),
     }
     exit_order_state._operator_last_requested_to_exit_indexes = {
@@ -349,7 +341,7 @@ def test_count_operator_validators_stats(
     'operator_validators, recently_operator_requested_to_exit_index, last_requested_to_exit_index, expected_result',
     [
         ([], {}, 0, 0),
-        (simple_validators(0, 9, exit_epoch="100500"), {7, 8, 9}, 9, 0),
+        (simple_validators(0, 9, exit_epoch=100500), {7, 8, 9}, 9, 0),
         (simple_validators(0, 9), {}, 0, 1),
         (simple_validators(0, 9), {}, 1, 2),
         (simple_validators(0, 9), {1}, 1, 1),
@@ -4,7 +4,7 @@ from unittest.mock import Mock
 import pytest
 
 from src.providers.consensus.client import ConsensusClient
-from src.providers.consensus.typings import Validator
+from src.providers.consensus.typings import Validator, ValidatorState
 from src.typings import SlotNumber
 from src.utils.blockstamp import build_blockstamp
 from src.variables import CONSENSUS_CLIENT_URI
@@ -73,3 +73,32 @@ def test_get_returns_nor_dict_nor_list(consensus_client: ConsensusClient):
 
     with raises:
         consensus_client._get_chain_id_with_provider(0)
+
+
+@pytest.mark.unit
+def test_get_validators_decodes_response(consensus_client: ConsensusClient):
+    raw_validator = {
+        'index': '1',
+        'balance': '32000000000',
+        'status': 'active_ongoing',
+        'validator': {
+            'pubkey': '0x01',
+            'withdrawal_credentials': '0x02',
+            'effective_balance': '32000000000',
+            'slashed': False,
+            'activation_eligibility_epoch': '0',
+            'activation_epoch': '0',
+            'exit_epoch': '18446744073709551615',
+            'withdrawable_epoch': '18446744073709551615',
+            'unknown_field': 'ignored',
+        },
+    }
+    consensus_client._get_without_fallbacks = Mock(return_value=([raw_validator], {}))
+
+    validators = consensus_client.get_validators_no_cache(BlockStampFactory.build())
+
+    assert len(validators) == 1
+    assert isinstance(validators[0].validator, ValidatorState)
+    assert validators[0].index == 1
+    assert validators[0].validator.pubkey == '0x01'
+    assert validators[0].validator.exit_epoch == 18446744073709551615
@@ -68,14 +68,14 @@ def test_get_bunker_start_or_last_successful_report_epoch(
 def validators():
     validators = ValidatorFactory.batch(2)
 
-    validators[0].validator.activation_epoch = "90"
+    validators[0].validator.activation_epoch = 90
     validators[0].validator.pubkey = "pubkey_validator_1"
-    validators[0].validator.withdrawable_epoch = "8292"
+    validators[0].validator.withdrawable_epoch = 8292
     validators[0].validator.slashed = True
 
-    validators[1].validator.activation_epoch = "90"
+    validators[1].validator.activation_epoch = 90
     validators[1].validator.pubkey = "pubkey_validator_2"
-    validators[1].validator.withdrawable_epoch = "8292"
+    validators[1].validator.withdrawable_epoch = 8292
     validators[1].validator.slashed = False
 
     return validators
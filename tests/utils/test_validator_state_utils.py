@@ -15,6 +15,7 @@ from src.utils.validator_state import (
     has_eth1_withdrawal_credential,
     is_exited_validator,
     is_active_validator,
+    count_exited_validators,
 )
 from tests.factory.no_registry import ValidatorFactory
 from tests.modules.accounting.bunker.test_bunker_abnormal_cl_rebase import simple_validators
@@ -28,22 +29,22 @@ from tests.modules.accounting.bunker.test_bunker_abnormal_cl_rebase import simpl
         (
             [
                 Validator(
-                    '0',
-                    '1',
+                    0,
+                    1,
                     ValidatorStatus.ACTIVE_ONGOING,
-                    ValidatorState('0x0', '', str(32 * 10**9), False, '', '15000', '15001', ''),
+                    ValidatorState('0x0', '', 32 * 10**9, False, 0, 15000, 15001, FAR_FUTURE_EPOCH),
                 ),
                 Validator(
-                    '1',
-                    '1',
+                    1,
+                    1,
                     ValidatorStatus.ACTIVE_EXITING,
-                    ValidatorState('0x1', '', str(31 * 10**9), False, '', '14999', '15000', ''),
+                    ValidatorState('0x1', '', 31 * 10**9, False, 0, 14999, 15000, FAR_FUTURE_EPOCH),
                 ),
                 Validator(
-                    '2',
-                    '1',
+                    2,
+                    1,
                     ValidatorStatus.ACTIVE_SLASHED,
-                    ValidatorState('0x2', '', str(31 * 10**9), True, '', '15000', '15001', ''),
+                    ValidatorState('0x2', '', 31 * 10**9, True, 0, 15000, 15001, FAR_FUTURE_EPOCH),
                 ),
             ],
             63 * 10**9,
@@ -51,16 +52,16 @@ from tests.modules.accounting.bunker.test_bunker_abnormal_cl_rebase import simpl
         (
             [
                 Validator(
-                    '0',
-                    '1',
+                    0,
+                    1,
                     ValidatorStatus.ACTIVE_ONGOING,
-                    ValidatorState('0x0', '', str(32 * 10**9), False, '', '14000', '14999', ''),
+                    ValidatorState('0x0', '', 32 * 10**9, False, 0, 14000, 14999, FAR_FUTURE_EPOCH),
                 ),
                 Validator(
-                    '1',
-                    '1',
+                    1,
+                    1,
                     ValidatorStatus.EXITED_SLASHED,
-                    ValidatorState('0x1', '', str(32 * 10**9), True, '', '15000', '15000', ''),
+                    ValidatorState('0x1', '', 32 * 10**9, True, 0, 15000, 15000, FAR_FUTURE_EPOCH),
                 ),
             ],
             0,
@@ -102,7 +103,7 @@ def test_get_validator_age(validator_activation_epoch, ref_epoch, expected_resul
     ],
 )
 def test_is_active_validator(activation_epoch, epoch, exit_epoch, expected):
-    validator = ValidatorFactory.build()
+    validator = ValidatorFactory.build_fast()
     validator.validator.activation_epoch = activation_epoch
     validator.validator.exit_epoch = exit_epoch
 
@@ -120,13 +121,30 @@ def test_is_active_validator(activation_epoch, epoch, exit_epoch, expected):
     ],
 )
 def test_is_exited_validator(exit_epoch, epoch, expected):
-    validator = ValidatorFactory.build()
+    validator = ValidatorFactory.build_fast()
     validator.validator.exit_epoch = exit_epoch
 
     actual = is_exited_validator(validator, EpochNumber(epoch))
     assert actual == expected
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "exit_epochs, epoch, expected",
+    [
+        ([], 176722, 0),
+        ([176720, 176722, 176730], 176722, 2),
+        ([FAR_FUTURE_EPOCH, 176720], 176722, 1),
+    ],
+)
+def test_count_exited_validators(exit_epochs, epoch, expected):
+    validators = [ValidatorFactory.build_fast() for _ in exit_epochs]
+    for validator, exit_epoch in zip(validators, exit_epochs):
+        validator.validator.exit_epoch = exit_epoch
+
+    assert count_exited_validators(validators, EpochNumber(epoch)) == expected
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize(
     "exit_epoch, expected",
@@ -136,7 +154,7 @@ def test_is_exited_validator(exit_epoch, epoch, expected):
     ],
 )
 def test_is_on_exit(exit_epoch, expected):
-    validator = ValidatorFactory.build()
+    validator = ValidatorFactory.build_fast()
     validator.validator.exit_epoch = exit_epoch
 
     actual = is_on_exit(validator)
@@ -154,7 +172,7 @@ def test_is_on_exit(exit_epoch, expected):
     ],
 )
 def test_has_eth1_withdrawal_credential(withdrawal_credentials, expected):
-    validator = ValidatorFactory.build()
+    validator = ValidatorFactory.build_fast()
     validator.validator.withdrawal_credentials = withdrawal_credentials
 
     actual = has_eth1_withdrawal_credential(validator)
@@ -172,7 +190,7 @@ def test_has_eth1_withdrawal_credential(withdrawal_credentials, expected):
     ],
 )
 def test_is_fully_withdrawable_validator(withdrawable_epoch, balance, epoch, expected):
-    validator = ValidatorFactory.build()
+    validator = ValidatorFactory.build_fast()
     validator.validator.withdrawable_epoch = withdrawable_epoch
     validator.validator.withdrawal_credentials = '0x01ba'
     validator.balance = balance
@@ -193,7 +211,7 @@ def test_is_fully_withdrawable_validator(withdrawable_epoch, balance, epoch, exp
     ],
 )
 def test_is_partially_withdrawable(effective_balance, add_balance, withdrawal_credentials, expected):
-    validator = ValidatorFactory.build()
+    validator = ValidatorFactory.build_fast()
     validator.validator.withdrawal_credentials = withdrawal_credentials
     validator.validator.effective_balance = effective_balance
     validator.balance = effective_balance + add_balance
@@ -212,7 +230,7 @@ def test_is_partially_withdrawable(effective_balance, add_balance, withdrawal_cr
     ],
 )
 def test_is_validator_eligible_to_exit(activation_epoch, exit_epoch, epoch, expected):
-    validator = ValidatorFactory.build()
+    validator = ValidatorFactory.build_fast()
     validator.validator.activation_epoch = activation_epoch
     validator.validator.exit_epoch = exit_epoch
 
@@ -223,7 +241,7 @@ def test_is_validator_eligible_to_exit(activation_epoch, exit_epoch, epoch, expe
 class TestCalculateTotalEffectiveBalance:
     @pytest.fixture
     def validators(self):
-        validators = ValidatorFactory.batch(2)
+        validators = [ValidatorFactory.build_fast() for _ in range(2)]
 
         validators[0].validator.activation_epoch = 170000
         validators[0].validator.exit_epoch = 2**64 - 1
@@ -250,27 +268,27 @@ class TestCalculateTotalEffectiveBalance:
     @pytest.mark.unit
     def test_no_balance_validators(self):
         actual = calculate_total_active_effective_balance(
-            simple_validators(0, 9, effective_balance="0"), EpochNumber(170256)
+            simple_validators(0, 9, effective_balance=0), EpochNumber(170256)
         )
         assert actual == EFFECTIVE_BALANCE_INCREMENT
 
     @pytest.mark.unit
     def test_skip_exiting(self, validators: list[Validator]):
-        validators[0].validator.exit_epoch = "170256"
+        validators[0].validator.exit_epoch = 170256
 
         actual = calculate_total_active_effective_balance(validators, EpochNumber(170256))
         assert actual == Gwei(2000000000)
 
     @pytest.mark.unit
     def test_skip_exited(self, validators: list[Validator]):
-        validators[0].validator.exit_epoch = "170000"
+        validators[0].validator.exit_epoch = 170000
 
         actual = calculate_total_active_effective_balance(validators, EpochNumber(170256))
         assert actual == Gwei(2000000000)
 
     @pytest.mark.unit
     def test_skip_exited_slashed(self, validators: list[Validator]):
-        validators[0].validator.exit_epoch = "170256"
+        validators[0].validator.exit_epoch = 170256
         validators[0].validator.slashed = True
 
         actual = calculate_total_active_effective_balance(validators, EpochNumber(170256))
@@ -285,7 +303,7 @@ class TestCalculateTotalEffectiveBalance:
 
     @pytest.mark.unit
     def test_skip_ongoing(self, validators: list[Validator]):
-        validators[0].validator.activation_epoch = "170257"
+        validators[0].validator.activation_epoch = 170257
 
         actual = calculate_total_active_effective_balance(validators, EpochNumber(170256))
         assert actual == Gwei(2000000000)
@@ -1,8 +1,14 @@
+from dataclasses import fields
 from unittest.mock import Mock
 
 import pytest
 
-from src.web3py.extensions.catalist_validators import CountOfKeysDiffersException, CatalistValidatorsProvider
+from src.providers.consensus.typings import Validator
+from src.web3py.extensions.catalist_validators import (
+    CountOfKeysDiffersException,
+    CatalistValidator,
+    CatalistValidatorsProvider,
+)
 from tests.factory.blockstamp import ReferenceBlockStampFactory
 from tests.factory.no_registry import (
     CatalistKeyFactory,
@@ -15,6 +21,18 @@ from tests.factory.no_registry import (
 blockstamp = ReferenceBlockStampFactory.build()
 
 
+@pytest.mark.unit
+def test_catalist_validator_from_validator():
+    validator = ValidatorFactory.build()
+    key = CatalistKeyFactory.generate_for_validators([validator])[0]
+
+    catalist_validator = CatalistValidator.from_validator(validator, key)
+
+    assert catalist_validator.catalist_id == key
+    for field in fields(Validator):
+        assert getattr(catalist_validator, field.name) == getattr(validator, field.name)
+
+
 @pytest.mark.unit
 def test_get_catalist_validators(web3, catalist_validators, contracts):
     validators = ValidatorFactory.batch(30)
@@ -69,6 +87,9 @@ def test_get_catalist_validators_by_node_operator(web3, catalist_validators, con
     assert len(no_validators[(1, 0)]) == 10
     assert len(no_validators[(1, 1)]) == 7
 
+    with pytest.raises(TypeError):
+        no_validators[(1, 0)] = []
+
 
 @pytest.mark.unit
 @pytest.mark.usefixtures('catalist_validators', 'contracts')